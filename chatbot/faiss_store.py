@@ -0,0 +1,189 @@
+"""
+FAISS-backed vector store for recipe retrieval.
+
+The recipe corpus is small enough to hold in memory, so exact inner-product
+search with faiss IndexFlatIP beats ChromaDB's sqlite-backed path by a wide
+margin (no per-query sqlite access, no pickle overhead). Embeddings are
+L2-normalized before insertion, so inner product equals cosine similarity.
+
+The index is persisted with faiss.write_index next to a JSON sidecar holding
+per-vector metadata (recipe_id, title, document snippet).
+"""
+
+import json
+import os
+
+from django.conf import settings
+
+
+def get_faiss_index_path() -> str:
+    """Path of the persisted FAISS index (FAISS_INDEX_PATH or a default)."""
+    path = getattr(settings, "FAISS_INDEX_PATH", None)
+    if not path:
+        path = os.path.join(settings.BASE_DIR, "faiss_recipe_index", "recipes.faiss")
+    return str(path)
+
+
+def _meta_path(index_path: str) -> str:
+    return index_path + ".meta.json"
+
+
+def _normalize(embeddings):
+    """L2-normalize a 2D float32 array row-wise (in place safe copy)."""
+    import numpy as np
+
+    arr = np.asarray(embeddings, dtype=np.float32)
+    if arr.ndim == 1:
+        arr = arr.reshape(1, -1)
+    norms = np.linalg.norm(arr, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return arr / norms
+
+
+def quantize_int8(embedding):
+    """
+    Quantize a float vector to int8 with a per-vector scale.
+    Returns (int8 array, scale); reconstruct with int8 * scale. Cuts storage
+    4x versus float32 and lets int8 dot-product kernels (AVX-VNNI) be used.
+    """
+    import numpy as np
+
+    arr = np.asarray(embedding, dtype=np.float32)
+    scale = float(np.abs(arr).max()) / 127.0
+    if scale == 0.0:
+        scale = 1.0
+    return np.round(arr / scale).astype(np.int8), scale
+
+
+class FaissStore:
+    """
+    Exact inner-product search over L2-normalized recipe embeddings.
+
+    With quantized=True the vectors are stored 8-bit scalar-quantized
+    (faiss QT_8bit), cutting index memory ~4x at negligible recall loss
+    for this corpus size.
+
+    metas is a list parallel to the index rows; each entry is a dict with
+    at least "recipe_id" and "title" (plus "document" for snippets).
+    """
+
+    def __init__(self, dim: int, quantized: bool = False):
+        import faiss
+
+        self.dim = dim
+        if quantized:
+            self.index = faiss.IndexScalarQuantizer(
+                dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+        else:
+            self.index = faiss.IndexFlatIP(dim)
+        self.metas = []
+
+    def __len__(self):
+        return self.index.ntotal
+
+    def add(self, embeddings, metas):
+        """Add a batch of embeddings with their parallel metadata dicts."""
+        arr = _normalize(embeddings)
+        if len(metas) != arr.shape[0]:
+            raise ValueError("metas must be parallel to embeddings")
+        if not self.index.is_trained:
+            # Scalar quantizers learn their value range from the first batch.
+            self.index.train(arr)
+        self.index.add(arr)
+        self.metas.extend(metas)
+
+    def search(self, query_embedding, k: int = 5):
+        """Return up to k (meta, score) pairs, best first."""
+        if len(self) == 0:
+            return []
+        q = _normalize(query_embedding)
+        scores, indices = self.index.search(q, min(k, len(self)))
+        out = []
+        for idx, score in zip(indices[0], scores[0]):
+            if idx < 0:
+                continue
+            out.append((self.metas[idx], float(score)))
+        return out
+
+    def save(self, path: str):
+        """Persist the index and metadata sidecar."""
+        import faiss
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        faiss.write_index(self.index, path)
+        with open(_meta_path(path), "w") as f:
+            json.dump(self.metas, f)
+
+    @classmethod
+    def load(cls, path: str):
+        """Load a previously saved store; returns None if files are missing."""
+        import faiss
+
+        if not (os.path.exists(path) and os.path.exists(_meta_path(path))):
+            return None
+        store = cls.__new__(cls)
+        store.index = faiss.read_index(path)
+        store.dim = store.index.d
+        with open(_meta_path(path)) as f:
+            store.metas = json.load(f)
+        return store
+
+
+class NumpyStore:
+    """
+    Exact inner-product search over a dense in-memory matrix, for when faiss
+    is not installed. Ranking one query against all recipes is a single
+    `embeddings @ q` matmul that NumPy dispatches to BLAS, which still beats
+    going through Chroma's sqlite-backed query path per message.
+
+    Exposes the same search interface as FaissStore.
+    """
+
+    def __init__(self, embeddings, metas):
+        self.embeddings = _normalize(embeddings)
+        self.metas = list(metas)
+
+    def __len__(self):
+        return self.embeddings.shape[0]
+
+    @classmethod
+    def from_chroma(cls, collection):
+        """Load every embedding out of a Chroma collection once."""
+        data = collection.get(include=["embeddings", "metadatas", "documents"])
+        embeddings = data.get("embeddings")
+        if embeddings is None or len(embeddings) == 0:
+            return None
+        metas = []
+        metadatas = data.get("metadatas") or []
+        documents = data.get("documents") or []
+        for i, doc_id in enumerate(data["ids"]):
+            meta = dict(metadatas[i]) if i < len(metadatas) and metadatas[i] else {}
+            meta.setdefault("recipe_id", int(doc_id))
+            meta["document"] = documents[i] if i < len(documents) else ""
+            metas.append(meta)
+        return cls(embeddings, metas)
+
+    def search(self, query_embedding, k: int = 5):
+        """Return up to k (meta, score) pairs, best first."""
+        import numpy as np
+
+        if len(self) == 0:
+            return []
+        q = _normalize(query_embedding)[0]
+        scores = self.embeddings @ q
+        k = min(k, len(self))
+        # O(N) argpartition to select the top k, then sort only those k,
+        # instead of an O(N log N) full argsort.
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.metas[i], float(scores[i])) for i in top]
+
+
+def faiss_available() -> bool:
+    """True when the optional faiss dependency is importable."""
+    try:
+        import faiss  # noqa: F401
+    except ImportError:
+        return False
+    return True
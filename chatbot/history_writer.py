@@ -0,0 +1,73 @@
+"""
+Background writer for ChatHistory rows.
+
+Saving chat history synchronously puts an INSERT on the hot path of every
+chat response. record_chat() enqueues the row instead, and a single daemon
+thread coalesces queued rows into bulk_create batches. History is
+best-effort: if the queue is full the caller falls back to a synchronous
+create rather than dropping the row.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Flush when this many rows are queued, or when the interval elapses.
+MAX_BATCH = 50
+FLUSH_INTERVAL = 0.5  # seconds
+QUEUE_MAX = 1000
+
+_queue = queue.Queue(maxsize=QUEUE_MAX)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def record_chat(**fields):
+    """Queue a ChatHistory row for background insertion."""
+    from chatbot.models import ChatHistory
+
+    _ensure_worker()
+    try:
+        _queue.put_nowait(ChatHistory(**fields))
+    except queue.Full:
+        ChatHistory.objects.create(**fields)
+
+
+def _ensure_worker():
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run, name="chat-history-writer", daemon=True
+            )
+            _worker.start()
+
+
+def _run():
+    from django.db import close_old_connections
+
+    from chatbot.models import ChatHistory
+
+    while True:
+        # Block for the first row, then drain up to MAX_BATCH rows for at
+        # most FLUSH_INTERVAL before writing.
+        batch = [_queue.get()]
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        try:
+            close_old_connections()
+            ChatHistory.objects.bulk_create(batch, batch_size=100)
+        except Exception:
+            logger.exception("Failed to write %d chat history rows", len(batch))
@@ -22,12 +22,30 @@ class Command(BaseCommand):
             action="store_true",
             help="Delete existing collection and re-index from scratch.",
         )
+        parser.add_argument(
+            "--store",
+            choices=["chroma", "faiss"],
+            default="chroma",
+            help="Vector store backend to index into (default: chroma).",
+        )
+        parser.add_argument(
+            "--quantize",
+            action="store_true",
+            help="Store FAISS vectors int8 scalar-quantized (4x less memory).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="Concurrent embedding requests while indexing (default: 8).",
+        )
 
     def handle(self, *args, **options):
         from chatbot.rag import (
             build_gemini_embedding_fn,
             build_openai_embedding_fn,
             get_chroma_collection,
+            get_embedding_cache_path,
             index_recipes_into_chroma,
             _use_gemini,
         )
@@ -49,6 +67,25 @@ class Command(BaseCommand):
             )
             return
 
+        provider = "Gemini" if use_gemini else "OpenAI"
+
+        if options["concurrency"]:
+            from chatbot import rag
+
+            rag.EMBED_CONCURRENCY = max(1, options["concurrency"])
+
+        if options["clear"]:
+            # Also drop the content-hash embedding cache so a forced
+            # re-index really re-embeds everything.
+            cache_path = get_embedding_cache_path()
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+                self.stdout.write(self.style.WARNING("Cleared embedding cache."))
+
+        if options["store"] == "faiss":
+            self._index_faiss(embedding_fn, provider, options)
+            return
+
         persist_dir = getattr(settings, "CHROMA_PERSIST_DIR", None)
         if not persist_dir:
             persist_dir = os.path.join(settings.BASE_DIR, "chroma_recipe_db")
@@ -77,8 +114,49 @@ class Command(BaseCommand):
             metadata={"description": "Recipe documents for RAG"},
         )
 
+        self._enable_wal(persist_dir)
         count = index_recipes_into_chroma(collection, embedding_fn, None)
-        provider = "Gemini" if use_gemini else "OpenAI"
         self.stdout.write(
             self.style.SUCCESS(f"Indexed {count} recipes into ChromaDB at {persist_dir} (using {provider}).")
         )
+
+    def _enable_wal(self, persist_dir):
+        """
+        Switch Chroma's sqlite file to WAL before bulk indexing. Chroma
+        wraps every add in its own transaction, so journal churn dominates
+        inserts; journal_mode is a persistent property of the database
+        file, so setting it here reaches Chroma's own connections.
+        Per-connection pragmas (synchronous, temp_store) would only affect
+        this throwaway connection, so none are issued.
+        """
+        import sqlite3
+
+        db_path = os.path.join(persist_dir, "chroma.sqlite3")
+        if not os.path.exists(db_path):
+            return
+        try:
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error:
+            # Best effort; indexing still works with the rollback journal.
+            pass
+
+    def _index_faiss(self, embedding_fn, provider, options):
+        from chatbot.faiss_store import faiss_available, get_faiss_index_path
+        from chatbot.rag import index_recipes_into_faiss
+
+        if not faiss_available():
+            self.stderr.write(self.style.ERROR("faiss is not installed. pip install faiss-cpu"))
+            return
+
+        index_path = get_faiss_index_path()
+        if options["clear"]:
+            for path in (index_path, index_path + ".meta.json"):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.stdout.write(self.style.WARNING(f"Deleted existing FAISS index at {index_path}."))
+
+        count = index_recipes_into_faiss(embedding_fn, index_path, quantized=options["quantize"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Indexed {count} recipes into FAISS at {index_path} (using {provider}).")
+        )
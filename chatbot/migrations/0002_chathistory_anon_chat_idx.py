@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-30 11:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chatbot', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chathistory',
+            index=models.Index(condition=models.Q(('user__isnull', True)), fields=['session_id', '-created_at'], name='anon_chat_idx'),
+        ),
+    ]
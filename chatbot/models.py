@@ -27,6 +27,13 @@ class ChatHistory(models.Model):
         indexes = [
             models.Index(fields=["session_id", "-created_at"]),
             models.Index(fields=["user", "-created_at"]),
+            # Anonymous sessions are the common case for session_id lookups;
+            # a partial index keeps it small.
+            models.Index(
+                fields=["session_id", "-created_at"],
+                condition=models.Q(user__isnull=True),
+                name="anon_chat_idx",
+            ),
         ]
 
     def __str__(self):
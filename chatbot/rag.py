@@ -7,31 +7,124 @@ Flow:
 3. Generate: Retrieved recipes + user message → LLM → answer
 """
 
+import functools
+import logging
 import os
+import re
 from typing import Optional
 
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
+# Max documents per embedding API call / Chroma add. Both the OpenAI and
+# Gemini endpoints enforce per-request limits and degrade on huge payloads.
+EMBED_BATCH_SIZE = 128
+
+# Concurrent embedding requests in flight during indexing. Batches are
+# independent, so overlapping their network round-trips gives a near-linear
+# speedup until the provider's rate limit kicks in.
+EMBED_CONCURRENCY = 8
+
+# Keyword extractor for fallback search: words of 3+ characters, in one
+# C-level pass (also handles non-ASCII queries, unlike split + len checks).
+_WORD_RE = re.compile(r"\w{3,}", re.UNICODE)
+
+# Process-local "collection is non-empty" flags so every chat message does
+# not pay a sqlite round-trip for collection.count(). Only re-checked while
+# still False (i.e. until the index has been built).
+_collection_ready = {}
+
+# Bumped after reindexing to invalidate memoized retrieval results.
+_cache_epoch = 0
+
+# Memoized query->top-k retrieval results. A plain dict keyed on scalar
+# values (epoch, backend, query, n) rather than an lru_cache over the live
+# store/collection/embedding-fn objects, which are not reliably hashable
+# (chromadb 0.4.x Collections are pydantic v1 models, for example).
+_retrieval_cache = {}
+_RETRIEVAL_CACHE_MAX = 1024
+
+
+def bump_retrieval_cache_epoch():
+    """Invalidate cached query->top-k retrieval results (after reindexing)."""
+    global _cache_epoch
+    _cache_epoch += 1
+    _retrieval_cache.clear()
+
+
+# Constant system prompt shared by both providers; built once instead of
+# being re-assembled on every response.
+_SYSTEM_PROMPT = (
+    "You are a helpful recipe assistant for a recipe sharing website. "
+    "Answer the user's question based ONLY on the recipe context below. "
+    "If the context doesn't contain enough information, say so and suggest they browse the site. "
+    "Keep answers concise and friendly. Mention recipe names when relevant."
+)
+
+
+def _build_user_content(user_message: str, retrieved: list) -> str:
+    """Assemble the context + question prompt shared by both providers."""
+    context = "\n".join(
+        f"[Recipe: {r['title']} (ID: {r['recipe_id']})]\n{r['snippet']}\n"
+        for r in retrieved
+    ) or "No specific recipes were found in the database."
+    return "Recipe context:\n" + context + "\n\nUser question: " + user_message
+
+
+def _collection_nonempty(collection, cache_key) -> bool:
+    """True once the collection has documents; count() runs only until then."""
+    if _collection_ready.get(cache_key):
+        return True
+    try:
+        ready = collection.count() > 0
+    except Exception:
+        return False
+    _collection_ready[cache_key] = ready
+    return ready
+
+
+def _embed_batches(embed_batch, texts, batch_size, concurrency):
+    """
+    Split texts into batches and embed them, overlapping API round-trips
+    with a thread pool when there is more than one batch.
+    """
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    if concurrency > 1 and len(batches) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as pool:
+            results = list(pool.map(embed_batch, batches))
+    else:
+        results = [embed_batch(batch) for batch in batches]
+
+    embeddings = []
+    for result in results:
+        embeddings.extend(result)
+    return embeddings
+
 
 def _get_recipe_document(recipe) -> str:
     """Build a single searchable text document from a Recipe instance."""
-    parts = [
+    # Ingredient names and quantities. Plain .all() reuses the
+    # prefetch_related cache from the caller; adding select_related here
+    # would discard it and re-query per recipe.
+    ingredients = ", ".join(
+        f"{ri.quantity} {ri.ingredient.name}" for ri in recipe.recipe_ingredients.all()
+    )
+    # Single join over a tuple literal: this runs once per recipe on the
+    # indexing path, so skip intermediate list appends.
+    parts = (
         f"Title: {recipe.title}",
         f"Description: {recipe.description}",
         f"Difficulty: {recipe.difficulty}",
         f"Prep time: {recipe.prep_time} minutes. Cook time: {recipe.cook_time} minutes.",
         f"Servings: {recipe.servings}",
         f"Instructions: {recipe.instructions}",
-    ]
-    # Add ingredient names and quantities
-    ing_parts = []
-    for ri in recipe.recipe_ingredients.select_related("ingredient").all():
-        ing_parts.append(f"{ri.quantity} {ri.ingredient.name}")
-    if ing_parts:
-        parts.append("Ingredients: " + ", ".join(ing_parts))
-    if recipe.category_id:
-        parts.append(f"Category: {recipe.category.name}")
-    return "\n".join(parts)
+        f"Ingredients: {ingredients}" if ingredients else "",
+        f"Category: {recipe.category.name}" if recipe.category_id else "",
+    )
+    return "\n".join(p for p in parts if p)
 
 
 def _get_openai_api_key() -> Optional[str]:
@@ -57,82 +150,222 @@ def _use_gemini() -> bool:
     return bool(_get_gemini_api_key())
 
 
-def index_recipes_into_chroma(collection, embedding_fn, Recipe):
+@functools.lru_cache(maxsize=None)
+def _cached_openai_client():
+    """Shared OpenAI client; construction is not free, so build it once."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=_get_openai_api_key())
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_gemini_client():
+    """Shared Gemini client, built once per process."""
+    from google import genai
+
+    return genai.Client(api_key=_get_gemini_api_key())
+
+
+def get_embedding_cache_path() -> str:
+    """Path of the persistent embedding cache (EMBEDDING_CACHE_PATH or a default)."""
+    path = getattr(settings, "EMBEDDING_CACHE_PATH", None)
+    if not path:
+        path = os.path.join(settings.BASE_DIR, "embedding_cache.sqlite3")
+    return str(path)
+
+
+def _embed_with_cache(embedding_fn, documents):
     """
-    Index all recipes into a ChromaDB collection.
-    collection: ChromaDB collection (with .add expecting ids, documents, metadatas).
-    embedding_fn: callable(documents: list[str]) -> list[list[float]].
-    Recipe: the Recipe model class (avoid circular import).
+    Embed documents, reusing cached embeddings for unchanged content.
+    Keyed on sha256 of the document text, so reindexing only calls the
+    embedding API for recipes whose documents actually changed.
+    """
+    import hashlib
+    import json
+    import sqlite3
+
+    conn = sqlite3.connect(get_embedding_cache_path())
+    try:
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache "
+            "(content_hash TEXT PRIMARY KEY, embedding TEXT NOT NULL)"
+        )
+        hashes = [hashlib.sha256(doc.encode()).hexdigest() for doc in documents]
+        placeholders = ",".join("?" * len(hashes))
+        cached = dict(conn.execute(
+            f"SELECT content_hash, embedding FROM embedding_cache "
+            f"WHERE content_hash IN ({placeholders})",
+            hashes,
+        ))
+        embeddings = [json.loads(cached[h]) if h in cached else None for h in hashes]
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        if missing:
+            fresh = embedding_fn([documents[i] for i in missing])
+            rows = []
+            for i, emb in zip(missing, fresh):
+                if not emb:
+                    # A transient provider failure must not be persisted:
+                    # a cached empty vector would be reused by every later
+                    # reindex until someone runs --clear.
+                    raise RuntimeError(
+                        "Embedding provider returned an empty vector"
+                    )
+                embeddings[i] = emb
+                rows.append((hashes[i], json.dumps(emb)))
+            conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (content_hash, embedding) "
+                "VALUES (?, ?)",
+                rows,
+            )
+            conn.commit()
+        return embeddings
+    finally:
+        conn.close()
+
+
+def _iter_recipe_document_rows(chunk_size: int = 500):
+    """
+    Stream (pk, title, document) rows from the denormalized search_document
+    column via iterator(chunk_size=...) — peak memory stays O(chunk_size)
+    instead of materializing the whole catalog before embedding starts.
+    Rows whose column is still empty (pre-denormalization data) are rebuilt
+    and backfilled as they stream past; that only happens once per row.
     """
     from recipes.models import Recipe as RecipeModel
 
-    recipes = list(
-        RecipeModel.objects.select_related("category")
-        .prefetch_related("recipe_ingredients__ingredient")
-    )
-    if not recipes:
-        return 0
+    qs = RecipeModel.objects.values_list("pk", "title", "search_document").order_by("pk")
+    for pk, title, doc in qs.iterator(chunk_size=chunk_size):
+        if not doc:
+            from chatbot.signals import refresh_search_documents
 
-    ids = []
-    documents = []
-    metadatas = []
+            refresh_search_documents([pk])
+            doc = RecipeModel.objects.values_list("search_document", flat=True).get(pk=pk)
+        yield pk, title, doc
 
-    for recipe in recipes:
-        ids.append(str(recipe.pk))
-        documents.append(_get_recipe_document(recipe))
-        metadatas.append({
-            "recipe_id": recipe.pk,
-            "title": recipe.title[:200],
-        })
 
-    # Chroma can do batch add; if embedding_fn is per-doc, we still pass texts
-    embeddings = embedding_fn(documents)
+def index_recipes_into_chroma(collection, embedding_fn, Recipe):
+    """
+    Index all recipes into a ChromaDB collection.
+    collection: ChromaDB collection (with .add expecting ids, documents, metadatas).
+    embedding_fn: callable(documents: list[str]) -> list[list[float]].
+    Recipe: the Recipe model class (avoid circular import).
+    """
+    # Flush enough rows per add for _embed_batches to split the embedding
+    # work into EMBED_CONCURRENCY parallel API batches; flushing every
+    # EMBED_BATCH_SIZE rows would hand the embed fn one batch at a time
+    # and the thread pool would never engage.
+    flush_size = EMBED_BATCH_SIZE * max(EMBED_CONCURRENCY, 1)
+    count = 0
+    batch = []
+    for row in _iter_recipe_document_rows():
+        batch.append(row)
+        if len(batch) == flush_size:
+            _add_chroma_batch(collection, embedding_fn, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        _add_chroma_batch(collection, embedding_fn, batch)
+        count += len(batch)
+    _cached_numpy_store.cache_clear()
+    bump_retrieval_cache_epoch()
+    return count
+
+
+def _add_chroma_batch(collection, embedding_fn, batch):
+    """Embed one batch of (pk, title, document) rows and add it to Chroma."""
+    documents = [doc for _pk, _title, doc in batch]
+    embeddings = _embed_with_cache(embedding_fn, documents)
     collection.add(
-        ids=ids,
+        ids=[str(pk) for pk, _title, _doc in batch],
         embeddings=embeddings,
         documents=documents,
-        metadatas=metadatas,
+        metadatas=[{"recipe_id": pk, "title": title[:200]} for pk, title, _doc in batch],
     )
-    return len(recipes)
 
 
-def get_chroma_collection(persist_directory: str, embedding_fn):
-    """Get or create a ChromaDB collection for recipes."""
+@functools.lru_cache(maxsize=None)
+def _cached_chroma_client(persist_directory: str):
+    """
+    Shared ChromaDB client per persist directory. When CHROMA_HOST is set,
+    this is a long-lived HttpClient against a chroma sidecar process, so
+    Django workers never open the sqlite files or warm the HNSW index
+    themselves. Otherwise it is a PersistentClient, built once because its
+    construction cost dominates per-query latency; both are safe to reuse.
+    """
     import chromadb
     from chromadb.config import Settings as ChromaSettings
 
-    client = chromadb.PersistentClient(
+    chroma_host = getattr(settings, "CHROMA_HOST", "")
+    if chroma_host:
+        return chromadb.HttpClient(
+            host=chroma_host,
+            port=getattr(settings, "CHROMA_PORT", 8000),
+            settings=ChromaSettings(anonymized_telemetry=False),
+        )
+
+    return chromadb.PersistentClient(
         path=persist_directory,
         settings=ChromaSettings(anonymized_telemetry=False),
     )
+
+
+@functools.lru_cache(maxsize=None)
+def _chroma_embedding_function(embedding_fn):
+    """
+    Wrap one of our embed callables as a chromadb EmbeddingFunction so the
+    collection can embed query_texts itself (one call instead of embed-then-query).
+    """
+    from chromadb import EmbeddingFunction
+
+    class RecipeEmbeddingFunction(EmbeddingFunction):
+        def __call__(self, input):
+            return embedding_fn(list(input))
+
+    return RecipeEmbeddingFunction()
+
+
+@functools.lru_cache(maxsize=None)
+def get_chroma_collection(persist_directory: str, embedding_fn=None):
+    """Get or create the (cached) ChromaDB collection for recipes."""
+    client = _cached_chroma_client(persist_directory)
+    kwargs = {}
+    if embedding_fn is not None:
+        kwargs["embedding_function"] = _chroma_embedding_function(embedding_fn)
     collection = client.get_or_create_collection(
         name="recipe_docs",
         metadata={"description": "Recipe documents for RAG"},
+        **kwargs,
     )
     return collection
 
 
+@functools.lru_cache(maxsize=None)
 def build_openai_embedding_fn():
-    """Build a function that embeds a list of texts using OpenAI."""
-    from openai import OpenAI
-
+    """Build (once per process) a function that embeds texts using OpenAI."""
     key = _get_openai_api_key()
     if not key:
         return None
 
-    client = OpenAI(api_key=key)
+    client = _cached_openai_client()
     model = "text-embedding-3-small"
 
-    def embed(texts):
-        out = client.embeddings.create(input=texts, model=model)
+    def embed_batch(batch):
+        out = client.embeddings.create(input=batch, model=model)
         return [item.embedding for item in out.data]
 
+    def embed(texts, batch_size=EMBED_BATCH_SIZE, concurrency=None):
+        if concurrency is None:
+            concurrency = EMBED_CONCURRENCY
+        return _embed_batches(embed_batch, texts, batch_size, concurrency)
+
     return embed
 
 
+@functools.lru_cache(maxsize=None)
 def build_gemini_embedding_fn(task_type: str = "RETRIEVAL_DOCUMENT"):
     """
-    Build a function that embeds a list of texts using Gemini (gemini-embedding-001).
+    Build (once per task_type) a function that embeds a list of texts using
+    Gemini (gemini-embedding-001).
     task_type: RETRIEVAL_DOCUMENT for indexing recipes, RETRIEVAL_QUERY for user queries.
     """
     key = _get_gemini_api_key()
@@ -140,45 +373,185 @@ def build_gemini_embedding_fn(task_type: str = "RETRIEVAL_DOCUMENT"):
         return None
 
     try:
-        from google import genai
         from google.genai import types
     except ImportError:
         return None
 
-    client = genai.Client(api_key=key)
+    client = _cached_gemini_client()
     model = "gemini-embedding-001"
 
-    def embed(texts):
+    def embed_batch(batch):
         result = client.models.embed_content(
             model=model,
-            contents=texts,
+            contents=batch,
             config=types.EmbedContentConfig(task_type=task_type),
         )
         if not result or not getattr(result, "embeddings", None):
-            return [[]] * len(texts) if texts else []
+            # Surface the failure instead of returning empty vectors that
+            # downstream code might index or cache.
+            raise RuntimeError("Gemini embed_content returned no embeddings")
         return [list(e.values) for e in result.embeddings]
 
+    def embed(texts, batch_size=EMBED_BATCH_SIZE, concurrency=None):
+        if concurrency is None:
+            concurrency = EMBED_CONCURRENCY
+        return _embed_batches(embed_batch, texts, batch_size, concurrency)
+
     return embed
 
 
-def retrieve_relevant_recipes(collection, query: str, embedding_fn, n: int = 5):
+def index_recipes_into_faiss(embedding_fn, index_path: str = None, quantized: bool = False):
+    """
+    Index all recipes into a FAISS store (see chatbot.faiss_store).
+    embedding_fn: callable(documents: list[str]) -> list[list[float]].
+    quantized: store vectors 8-bit scalar-quantized (4x less memory).
+    Returns the number of recipes indexed.
+    """
+    from chatbot.faiss_store import get_faiss_index_path
+
+    if not index_path:
+        index_path = get_faiss_index_path()
+
+    # Same flush sizing as the Chroma indexer: give the embed fn
+    # EMBED_CONCURRENCY batches' worth of rows so its thread pool engages.
+    flush_size = EMBED_BATCH_SIZE * max(EMBED_CONCURRENCY, 1)
+    store = None
+    count = 0
+    batch = []
+    for row in _iter_recipe_document_rows():
+        batch.append(row)
+        if len(batch) == flush_size:
+            store = _add_faiss_batch(store, embedding_fn, batch, quantized)
+            count += len(batch)
+            batch = []
+    if batch:
+        store = _add_faiss_batch(store, embedding_fn, batch, quantized)
+        count += len(batch)
+
+    if store is None:
+        return 0
+    store.save(index_path)
+    _cached_faiss_store.cache_clear()
+    bump_retrieval_cache_epoch()
+    return count
+
+
+def _add_faiss_batch(store, embedding_fn, batch, quantized):
+    """Embed one batch of rows and add it to the store (created lazily)."""
+    from chatbot.faiss_store import FaissStore
+
+    documents = [doc for _pk, _title, doc in batch]
+    embeddings = _embed_with_cache(embedding_fn, documents)
+    if store is None:
+        store = FaissStore(dim=len(embeddings[0]), quantized=quantized)
+    store.add(embeddings, [
+        {"recipe_id": pk, "title": title[:200], "document": doc}
+        for pk, title, doc in batch
+    ])
+    return store
+
+
+def _index_version_stamp(path: str) -> float:
+    """
+    mtime of an index's backing file, used as a cross-process version key.
+    manage.py index_recipes runs in its own process, so in-process
+    cache_clear/epoch bumps never reach the web workers — but a reindex
+    always rewrites the file, so keying snapshots on its mtime makes every
+    worker pick up the new corpus on its next message instead of answering
+    from the old snapshot until restart. Returns 0.0 while no file exists.
+    """
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return 0.0
+
+
+def _chroma_version_stamp(persist_directory: str) -> float:
+    """Version stamp of a local Chroma persist dir (mtime of its sqlite file).
+
+    In CHROMA_HOST mode the sidecar serves the same --path, so the stamp
+    still moves on reindex as long as the sidecar shares the filesystem.
+    """
+    return _index_version_stamp(os.path.join(persist_directory, "chroma.sqlite3"))
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_faiss_store(index_path: str, version: float):
+    """Load the persisted FAISS store once per on-disk version.
+
+    maxsize=1 drops the superseded snapshot when the version moves instead
+    of keeping every generation of the corpus alive.
+    """
+    from chatbot.faiss_store import FaissStore
+
+    return FaissStore.load(index_path)
+
+
+def _get_faiss_store():
+    """Return the FAISS store if faiss is installed and an index exists."""
+    from chatbot.faiss_store import faiss_available, get_faiss_index_path
+
+    if not faiss_available():
+        return None
+    try:
+        index_path = get_faiss_index_path()
+        return _cached_faiss_store(index_path, _index_version_stamp(index_path))
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_numpy_store(persist_directory: str, version: float):
+    """
+    Load all embeddings out of the Chroma collection once per on-disk
+    version into an in-memory NumpyStore so per-message ranking is a single
+    BLAS matmul instead of a Chroma query. Returns None when the collection
+    is empty or unreadable.
+    """
+    from chatbot.faiss_store import NumpyStore
+
+    try:
+        collection = get_chroma_collection(persist_directory)
+        return NumpyStore.from_chroma(collection)
+    except Exception:
+        return None
+
+
+def retrieve_relevant_recipes_from_store(store, query: str, embedding_fn, n: int = 5):
+    """
+    Retrieve top-n recipes from an in-process store (FaissStore/NumpyStore).
+    Returns the same dict shape as retrieve_relevant_recipes.
+    """
+    if not query.strip():
+        return []
+    query_embedding = embedding_fn([query.strip()])[0]
+    out = []
+    for meta, _score in store.search(query_embedding, k=n):
+        doc = meta.get("document", "")
+        snippet = (doc[:300] + "...") if len(doc) > 300 else doc
+        out.append({
+            "recipe_id": meta["recipe_id"],
+            "title": meta.get("title", ""),
+            "snippet": snippet,
+        })
+    return out
+
+
+def retrieve_relevant_recipes(collection, query: str, n: int = 5):
     """
     Retrieve top-n recipe IDs and their snippets from ChromaDB.
+    The collection's registered embedding_function embeds the query text,
+    so embedding + search happen in a single call.
     Returns list of dicts: [{"recipe_id": int, "title": str, "snippet": str}, ...]
     """
     if not query.strip():
         return []
-    try:
-        total = collection.count()
-    except Exception:
-        total = 0
-    if total == 0:
+    if not _collection_nonempty(collection, id(collection)):
         return []
 
-    query_embedding = embedding_fn([query.strip()])[0]
     results = collection.query(
-        query_embeddings=[query_embedding],
-        n_results=min(n, total),
+        query_texts=[query.strip()],
+        n_results=n,
         include=["documents", "metadatas", "distances"],
     )
 
@@ -205,8 +578,6 @@ def generate_answer_with_openai(user_message: str, retrieved: list, base_url: st
     Build a prompt from retrieved recipes and call OpenAI to generate an answer.
     base_url: e.g. "http://127.0.0.1:8001" for linking recipes in the answer.
     """
-    from openai import OpenAI
-
     key = _get_openai_api_key()
     if not key:
         return (
@@ -215,29 +586,14 @@ def generate_answer_with_openai(user_message: str, retrieved: list, base_url: st
             "You can still search recipes on the site!"
         )
 
-    client = OpenAI(api_key=key)
+    client = _cached_openai_client()
 
-    context_parts = []
-    for r in retrieved:
-        link = f"{base_url}/{r['recipe_id']}/" if base_url else ""
-        context_parts.append(f"[Recipe: {r['title']} (ID: {r['recipe_id']})]\n{r['snippet']}\n")
-
-    context = "\n".join(context_parts) if context_parts else "No specific recipes were found in the database."
-
-    system = (
-        "You are a helpful recipe assistant for a recipe sharing website. "
-        "Answer the user's question based ONLY on the recipe context below. "
-        "If the context doesn't contain enough information, say so and suggest they browse the site. "
-        "Keep answers concise and friendly. Mention recipe names when relevant."
-    )
-    user_content = (
-        "Recipe context:\n" + context + "\n\nUser question: " + user_message
-    )
+    user_content = _build_user_content(user_message, retrieved)
 
     response = client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[
-            {"role": "system", "content": system},
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": user_content},
         ],
         max_tokens=500,
@@ -245,6 +601,39 @@ def generate_answer_with_openai(user_message: str, retrieved: list, base_url: st
     return response.choices[0].message.content or "I couldn't generate an answer."
 
 
+def generate_answer_stream_with_openai(user_message: str, retrieved: list, base_url: str = ""):
+    """
+    Streaming counterpart of generate_answer_with_openai: yields answer
+    chunks as OpenAI generates them, so the first token reaches the user
+    without waiting for the full completion.
+    """
+    key = _get_openai_api_key()
+    if not key:
+        yield (
+            "I don't have an API key configured for the AI. "
+            "Add OPENAI_API_KEY to your environment to enable smart answers. "
+            "You can still search recipes on the site!"
+        )
+        return
+
+    client = _cached_openai_client()
+
+    user_content = _build_user_content(user_message, retrieved)
+
+    stream = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": user_content},
+        ],
+        max_tokens=500,
+        stream=True,
+    )
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+
 def generate_answer_with_gemini(user_message: str, retrieved: list, base_url: str = "") -> str:
     """
     Build a prompt from retrieved recipes and call Gemini to generate an answer.
@@ -258,31 +647,19 @@ def generate_answer_with_gemini(user_message: str, retrieved: list, base_url: st
         )
 
     try:
-        from google import genai
         from google.genai import types
     except ImportError:
         return "Please install google-genai: pip install google-genai"
 
-    client = genai.Client(api_key=key)
-
-    context_parts = []
-    for r in retrieved:
-        context_parts.append(f"[Recipe: {r['title']} (ID: {r['recipe_id']})]\n{r['snippet']}\n")
-    context = "\n".join(context_parts) if context_parts else "No specific recipes were found in the database."
+    client = _cached_gemini_client()
 
-    system = (
-        "You are a helpful recipe assistant for a recipe sharing website. "
-        "Answer the user's question based ONLY on the recipe context below. "
-        "If the context doesn't contain enough information, say so and suggest they browse the site. "
-        "Keep answers concise and friendly. Mention recipe names when relevant."
-    )
-    user_content = "Recipe context:\n" + context + "\n\nUser question: " + user_message
+    user_content = _build_user_content(user_message, retrieved)
 
     response = client.models.generate_content(
         model="gemini-2.5-flash",
         contents=user_content,
         config=types.GenerateContentConfig(
-            system_instruction=system,
+            system_instruction=_SYSTEM_PROMPT,
             max_output_tokens=500,
         ),
     )
@@ -291,29 +668,85 @@ def generate_answer_with_gemini(user_message: str, retrieved: list, base_url: st
     return "I couldn't generate an answer."
 
 
+def generate_answer_stream_with_gemini(user_message: str, retrieved: list, base_url: str = ""):
+    """
+    Streaming counterpart of generate_answer_with_gemini: yields answer
+    chunks as Gemini generates them.
+    """
+    key = _get_gemini_api_key()
+    if not key:
+        yield (
+            "I don't have a Gemini API key configured. "
+            "Add GEMINI_API_KEY to your environment to enable smart answers. "
+            "You can still search recipes on the site!"
+        )
+        return
+
+    try:
+        from google.genai import types
+    except ImportError:
+        yield "Please install google-genai: pip install google-genai"
+        return
+
+    client = _cached_gemini_client()
+
+    user_content = _build_user_content(user_message, retrieved)
+
+    stream = client.models.generate_content_stream(
+        model="gemini-2.5-flash",
+        contents=user_content,
+        config=types.GenerateContentConfig(
+            system_instruction=_SYSTEM_PROMPT,
+            max_output_tokens=500,
+        ),
+    )
+    for chunk in stream:
+        if getattr(chunk, "text", None):
+            yield chunk.text
+
+
 def fallback_answer(user_message: str, Recipe) -> tuple[str, list]:
     """
-    When Chroma/OpenAI is not available: simple keyword search on Recipe model.
+    When Chroma/OpenAI is not available: keyword search on Recipe model.
+    Uses Postgres full-text search when available (one indexed query instead
+    of an ILIKE scan per keyword); falls back to icontains on other backends.
     Returns (answer_text, list of recipe IDs that were used).
     """
+    from django.db import connection
     from django.db.models import Q
 
-    # Simple keyword search on title, description, instructions
-    words = [w.strip() for w in user_message.split() if len(w.strip()) > 2][:5]
+    words = _WORD_RE.findall(user_message)[:5]
     if not words:
         return (
             "Ask me about recipes, ingredients, or cooking! For example: 'Easy Italian recipes' or 'What can I make with tomatoes?'",
             [],
         )
 
-    q = Q()
-    for w in words:
-        q |= (
-            Q(title__icontains=w)
-            | Q(description__icontains=w)
-            | Q(instructions__icontains=w)
+    if connection.vendor == "postgresql":
+        from django.contrib.postgres.search import (
+            SearchQuery,
+            SearchRank,
+            SearchVector,
         )
-    recipes = list(Recipe.objects.filter(q).select_related("category").distinct()[:5])
+
+        search_query = SearchQuery(user_message, search_type="websearch")
+        vector = SearchVector("title", "description", "instructions")
+        recipes = list(
+            Recipe.objects.annotate(search=vector, rank=SearchRank(vector, search_query))
+            .filter(search=search_query)
+            .select_related("category")
+            .order_by("-rank")[:5]
+        )
+    else:
+        # Simple keyword search on title, description, instructions
+        q = Q()
+        for w in words:
+            q |= (
+                Q(title__icontains=w)
+                | Q(description__icontains=w)
+                | Q(instructions__icontains=w)
+            )
+        recipes = list(Recipe.objects.filter(q).select_related("category").distinct()[:5])
     recipe_ids = [r.pk for r in recipes]
 
     if not recipes:
@@ -330,6 +763,114 @@ def fallback_answer(user_message: str, Recipe) -> tuple[str, list]:
     return answer, recipe_ids
 
 
+def _fallback_retrieved_docs(recipe_ids: list, Recipe) -> list:
+    """Build retrieved_docs entries for fallback answers with one IN query."""
+    if not recipe_ids:
+        return []
+    titles = dict(Recipe.objects.filter(pk__in=recipe_ids).values_list("pk", "title"))
+    return [{"recipe_id": rid, "title": titles.get(rid, "")} for rid in recipe_ids]
+
+
+def _choose_provider(streaming: bool = False):
+    """
+    Pick the query embedding fn and answer fn for the configured provider.
+    Prefers Gemini when GEMINI_API_KEY is set, otherwise uses OpenAI.
+    """
+    if _use_gemini():
+        embedding_fn = build_gemini_embedding_fn("RETRIEVAL_QUERY")  # for user query
+        answer_fn = (
+            generate_answer_stream_with_gemini if streaming else generate_answer_with_gemini
+        )
+    else:
+        embedding_fn = build_openai_embedding_fn()
+        answer_fn = (
+            generate_answer_stream_with_openai if streaming else generate_answer_with_openai
+        )
+    return embedding_fn, answer_fn
+
+
+def _retrieve_context(user_message: str, embedding_fn):
+    """
+    Retrieve context recipes for a message via FAISS, the in-process numpy
+    store, or Chroma. Returns (status, retrieved) where status is "ok"
+    (retrieval ran), "error" (retrieval failed) or "unavailable".
+    """
+    persist_dir = getattr(settings, "CHROMA_PERSIST_DIR", None)
+    if not persist_dir:
+        persist_dir = os.path.join(settings.BASE_DIR, "chroma_recipe_db")
+
+    # Prefer the in-process FAISS index when one has been built; otherwise
+    # fall back to the ChromaDB collection (ranked in-process when possible).
+    store = _get_faiss_store() if embedding_fn else None
+    if store is not None and len(store) == 0:
+        store = None
+
+    collection = None
+    chroma_available = bool(getattr(settings, "CHROMA_HOST", "")) or os.path.isdir(persist_dir)
+    use_rag = bool(embedding_fn and (store is not None or chroma_available))
+
+    if use_rag and store is None:
+        try:
+            collection = get_chroma_collection(persist_dir, embedding_fn)
+            if not _collection_nonempty(collection, persist_dir):
+                use_rag = False
+            else:
+                numpy_store = _cached_numpy_store(
+                    persist_dir, _chroma_version_stamp(persist_dir)
+                )
+                if numpy_store is not None and len(numpy_store):
+                    store = numpy_store
+        except Exception:
+            use_rag = False
+
+    if not use_rag:
+        return "unavailable", []
+
+    try:
+        query_key = " ".join(user_message.lower().split())
+        # The on-disk version stamps are part of the key so memoized
+        # results also roll over after a reindex in another process (the
+        # process-local epoch only covers reindexes in this one).
+        from chatbot.faiss_store import get_faiss_index_path
+
+        backend = (
+            type(store).__name__ if store is not None else "chroma",
+            persist_dir,
+            _index_version_stamp(get_faiss_index_path()),
+            _chroma_version_stamp(persist_dir),
+        )
+        retrieved = _cached_retrieval(
+            backend, query_key, 5, store, collection, embedding_fn
+        )
+    except Exception:
+        logger.exception("Recipe retrieval failed for query %r", user_message)
+        return "error", []
+    return "ok", retrieved
+
+
+def _cached_retrieval(backend, query_key, n, store, collection, embedding_fn):
+    """
+    Memoized top-k retrieval keyed on the whitespace-normalized, lowercased
+    query. Duplicate chatbot queries ("easy dinner", "vegan", ...) skip both
+    the embedding API call and the vector search. The key holds only scalar
+    values (epoch, backend name + persist dir, query, n) — the live service
+    objects are passed through but never hashed. The epoch is bumped after
+    reindexing to invalidate stale results.
+    """
+    cache_key = (_cache_epoch, backend, query_key, n)
+    hit = _retrieval_cache.get(cache_key)
+    if hit is not None:
+        return hit
+    if store is not None:
+        result = retrieve_relevant_recipes_from_store(store, query_key, embedding_fn, n=n)
+    else:
+        result = retrieve_relevant_recipes(collection, query_key, n=n)
+    if len(_retrieval_cache) >= _RETRIEVAL_CACHE_MAX:
+        _retrieval_cache.clear()
+    _retrieval_cache[cache_key] = result
+    return result
+
+
 def get_rag_response(user_message: str, request=None) -> dict:
     """
     Full RAG pipeline: retrieve recipes (from Chroma if available), then generate answer.
@@ -348,34 +889,11 @@ def get_rag_response(user_message: str, request=None) -> dict:
     if request:
         base_url = request.build_absolute_uri("/").rstrip("/")
 
-    persist_dir = getattr(settings, "CHROMA_PERSIST_DIR", None)
-    if not persist_dir:
-        persist_dir = os.path.join(settings.BASE_DIR, "chroma_recipe_db")
-
-    # Prefer Gemini (free tier), then OpenAI
-    use_gemini = _use_gemini()
-    if use_gemini:
-        embedding_fn = build_gemini_embedding_fn("RETRIEVAL_QUERY")  # for user query
-        generate_fn = generate_answer_with_gemini
-    else:
-        embedding_fn = build_openai_embedding_fn()
-        generate_fn = generate_answer_with_openai
-
-    use_rag = bool(embedding_fn and os.path.isdir(persist_dir))
+    embedding_fn, generate_fn = _choose_provider()
+    status, retrieved = _retrieve_context(user_message, embedding_fn)
 
-    if use_rag:
+    if status == "ok":
         try:
-            collection = get_chroma_collection(persist_dir, embedding_fn)
-            if collection.count() == 0:
-                use_rag = False
-        except Exception:
-            use_rag = False
-
-    if use_rag:
-        try:
-            retrieved = retrieve_relevant_recipes(
-                collection, user_message, embedding_fn, n=5
-            )
             if retrieved:
                 answer = generate_fn(user_message, retrieved, base_url)
                 confidence = 0.9
@@ -389,21 +907,49 @@ def get_rag_response(user_message: str, request=None) -> dict:
                 retrieved_docs = []
         except Exception:
             answer, recipe_ids = fallback_answer(user_message, Recipe)
-            retrieved_docs = [
-                {"recipe_id": rid, "title": Recipe.objects.filter(pk=rid).values_list("title", flat=True).first() or ""}
-                for rid in recipe_ids
-            ]
+            retrieved_docs = _fallback_retrieved_docs(recipe_ids, Recipe)
             confidence = 0.5
     else:
         answer, recipe_ids = fallback_answer(user_message, Recipe)
-        retrieved_docs = [
-            {"recipe_id": rid, "title": Recipe.objects.filter(pk=rid).values_list("title", flat=True).first() or ""}
-            for rid in recipe_ids
-        ]
-        confidence = 0.6
+        retrieved_docs = _fallback_retrieved_docs(recipe_ids, Recipe)
+        confidence = 0.5 if status == "error" else 0.6
 
     return {
         "answer": answer,
         "retrieved_docs": retrieved_docs,
         "confidence": confidence,
     }
+
+
+def get_rag_response_stream(user_message: str, request=None):
+    """
+    Streaming variant of get_rag_response. Returns (chunks, meta) where
+    chunks is an iterator of answer text pieces and meta is
+    {"retrieved_docs": [...], "confidence": float}, known before
+    generation starts. The fallback paths yield their answer as one chunk.
+    """
+    from recipes.models import Recipe
+
+    base_url = ""
+    if request:
+        base_url = request.build_absolute_uri("/").rstrip("/")
+
+    embedding_fn, stream_fn = _choose_provider(streaming=True)
+    status, retrieved = _retrieve_context(user_message, embedding_fn)
+
+    if status == "ok":
+        retrieved_docs = [
+            {"recipe_id": r["recipe_id"], "title": r["title"]} for r in retrieved
+        ]
+        meta = {
+            "retrieved_docs": retrieved_docs,
+            "confidence": 0.9 if retrieved else 0.6,
+        }
+        return stream_fn(user_message, retrieved, base_url), meta
+
+    answer, recipe_ids = fallback_answer(user_message, Recipe)
+    meta = {
+        "retrieved_docs": _fallback_retrieved_docs(recipe_ids, Recipe),
+        "confidence": 0.5 if status == "error" else 0.6,
+    }
+    return iter([answer]), meta
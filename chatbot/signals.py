@@ -0,0 +1,46 @@
+"""
+Keep Recipe.search_document in sync with the fields it is built from.
+
+The denormalized column lets indexing read one flat projection
+(values_list of pk/title/search_document) instead of traversing
+ingredients and category for every recipe on every index run.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from recipes.models import Category, Recipe, RecipeIngredient
+
+
+def refresh_search_documents(recipe_ids):
+    """Rebuild and store search_document for the given recipe ids."""
+    from chatbot.rag import _get_recipe_document
+
+    qs = (
+        Recipe.objects.filter(pk__in=recipe_ids)
+        .select_related("category")
+        .prefetch_related("recipe_ingredients__ingredient")
+    )
+    for recipe in qs:
+        # .update() does not re-fire post_save, so no recursion here.
+        Recipe.objects.filter(pk=recipe.pk).update(
+            search_document=_get_recipe_document(recipe)
+        )
+
+
+@receiver(post_save, sender=Recipe)
+def _recipe_saved(sender, instance, **kwargs):
+    refresh_search_documents([instance.pk])
+
+
+@receiver(post_save, sender=RecipeIngredient)
+@receiver(post_delete, sender=RecipeIngredient)
+def _recipe_ingredient_changed(sender, instance, **kwargs):
+    refresh_search_documents([instance.recipe_id])
+
+
+@receiver(post_save, sender=Category)
+def _category_saved(sender, instance, **kwargs):
+    refresh_search_documents(
+        Recipe.objects.filter(category=instance).values_list("pk", flat=True)
+    )
@@ -6,5 +6,6 @@ app_name = "chatbot"
 urlpatterns = [
     path("chat/", views.ChatView.as_view(), name="chat"),
     path("api/chat/", views.ChatAPIView.as_view(), name="chat_api"),
+    path("api/chat/stream/", views.ChatStreamAPIView.as_view(), name="chat_stream_api"),
     path("history/", views.ChatHistoryView.as_view(), name="chat_history"),
 ]
@@ -1,6 +1,6 @@
 from django.shortcuts import render
 from django.views.generic import View
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 import json
@@ -17,10 +17,11 @@ class ChatView(View):
         session_id = request.session.get("chat_session_id", str(uuid.uuid4()))
         request.session["chat_session_id"] = session_id
         
-        # Get recent chat history
+        # Get recent chat history. The template only renders message,
+        # response and timestamp, so skip the retrieved_docs JSON payload.
         recent_chats = ChatHistory.objects.filter(
             session_id=session_id
-        ).order_by("-created_at")[:10]
+        ).only("session_id", "message", "response", "created_at").order_by("-created_at")[:10]
         
         context = {
             "session_id": session_id,
@@ -45,9 +46,10 @@ class ChatAPIView(View):
             
             from chatbot.rag import get_rag_response
             response = get_rag_response(message, request=request)
-            
-            # Save chat history
-            ChatHistory.objects.create(
+
+            # Save chat history off the request path
+            from chatbot.history_writer import record_chat
+            record_chat(
                 user=request.user if request.user.is_authenticated else None,
                 session_id=session_id,
                 message=message,
@@ -67,13 +69,69 @@ class ChatAPIView(View):
         except Exception as e:
             return JsonResponse({"error": str(e)}, status=500)
 
+@method_decorator(csrf_exempt, name="dispatch")
+class ChatStreamAPIView(View):
+    """SSE endpoint that streams the bot's answer as it is generated"""
+
+    def post(self, request):
+        try:
+            data = json.loads(request.body)
+        except json.JSONDecodeError:
+            return JsonResponse({"error": "Invalid JSON"}, status=400)
+
+        message = data.get("message", "")
+        session_id = data.get("session_id", str(uuid.uuid4()))
+
+        if not message:
+            return JsonResponse({"error": "Message is required"}, status=400)
+
+        from chatbot.rag import get_rag_response_stream
+        chunks, meta = get_rag_response_stream(message, request=request)
+
+        user = request.user if request.user.is_authenticated else None
+
+        def events():
+            # Accumulate the full answer while streaming so chat history
+            # still stores the complete response at the end.
+            parts = []
+            for chunk in chunks:
+                parts.append(chunk)
+                yield "data: " + json.dumps({"delta": chunk}) + "\n\n"
+
+            from chatbot.history_writer import record_chat
+            record_chat(
+                user=user,
+                session_id=session_id,
+                message=message,
+                response="".join(parts),
+                retrieved_docs=meta["retrieved_docs"],
+                confidence_score=meta["confidence"],
+            )
+            yield "data: " + json.dumps({
+                "done": True,
+                "retrieved_docs": meta["retrieved_docs"],
+                "confidence": meta["confidence"],
+            }) + "\n\n"
+
+        response = StreamingHttpResponse(events(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
 class ChatHistoryView(View):
     """View chat history"""
     template_name = "chatbot/history.html"
 
     def get(self, request):
         session_id = request.session.get("chat_session_id")
-        chats = ChatHistory.objects.filter(session_id=session_id).order_by("-created_at") if session_id else []
+        chats = (
+            ChatHistory.objects.filter(session_id=session_id)
+            .only("session_id", "message", "response", "created_at")
+            .order_by("-created_at")
+            if session_id
+            else []
+        )
         
         context = {
             "chats": chats,
@@ -72,6 +72,7 @@ TEMPLATES = [
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.request",
+                "django.template.context_processors.media",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
@@ -157,3 +158,9 @@ LOGOUT_REDIRECT_URL = "accounts:login"
 GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
 CHROMA_PERSIST_DIR = os.path.join(BASE_DIR, "chroma_recipe_db")
+
+# Optional Chroma server mode: when CHROMA_HOST is set, the chatbot talks to
+# a chroma sidecar ("chroma run --path ...") over a long-lived HTTP client
+# instead of opening the sqlite files inside the Django workers.
+CHROMA_HOST = os.environ.get("CHROMA_HOST", "")
+CHROMA_PORT = int(os.environ.get("CHROMA_PORT", "8000"))
@@ -0,0 +1,75 @@
+"""
+Background processing for recipe images.
+
+ImageField with width_field/height_field opens the uploaded file with
+Pillow inside the request thread on every save. Instead, the cached
+image_width/image_height columns are filled in by a daemon worker (same
+pattern as chatbot.history_writer), so the upload request returns without
+touching the image bytes.
+"""
+
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+QUEUE_MAX = 1000
+
+_queue = queue.Queue(maxsize=QUEUE_MAX)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def schedule_image_processing(recipe_id):
+    """Queue a recipe's image for background dimension extraction."""
+    _ensure_worker()
+    try:
+        _queue.put_nowait(recipe_id)
+    except queue.Full:
+        # Best-effort: process inline rather than dropping the update.
+        _process(recipe_id)
+
+
+def _ensure_worker():
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run, name="recipe-image-worker", daemon=True
+            )
+            _worker.start()
+
+
+def _process(recipe_id):
+    from PIL import Image
+
+    from recipes.models import Recipe
+
+    recipe = Recipe.objects.filter(pk=recipe_id).only("id", "image").first()
+    if recipe is None or not recipe.image:
+        return
+    try:
+        with recipe.image.open("rb") as fh, Image.open(fh) as img:
+            width, height = img.size
+    except (OSError, ValueError):
+        logger.warning("Could not read image for recipe %s", recipe_id)
+        return
+    # .update() keeps this off the signal path (no post_save re-fire).
+    Recipe.objects.filter(pk=recipe_id).update(
+        image_width=width, image_height=height
+    )
+
+
+def _run():
+    from django.db import close_old_connections
+
+    while True:
+        recipe_id = _queue.get()
+        try:
+            close_old_connections()
+            _process(recipe_id)
+        except Exception:
+            logger.exception("Failed to process image for recipe %s", recipe_id)
@@ -0,0 +1,49 @@
+"""
+Trigram GIN indexes for recipe search (PostgreSQL only).
+
+icontains search with a leading wildcard cannot use a btree index, so
+RecipeSearchView forced sequential scans. pg_trgm GIN indexes let the
+planner answer similarity search with index probes instead. On other
+backends (SQLite dev) this migration is a no-op and the view keeps its
+icontains fallback.
+"""
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ("recipe_title_trgm", "recipes_recipe", "title"),
+    ("recipe_description_trgm", "recipes_recipe", "description"),
+    ("recipe_instructions_trgm", "recipes_recipe", "instructions"),
+    ("ingredient_name_trgm", "recipes_ingredient", "name"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, table, column in TRIGRAM_INDEXES:
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+                f"USING gin ({column} gin_trgm_ops)"
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for name, _table, _column in TRIGRAM_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recipes", "0002_recipe_search_document"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
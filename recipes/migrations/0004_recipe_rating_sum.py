@@ -0,0 +1,35 @@
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_rating_sum(apps, schema_editor):
+    """Seed rating_sum (and resync the other rating columns) from reviews."""
+    Recipe = apps.get_model("recipes", "Recipe")
+    Review = apps.get_model("recipes", "Review")
+
+    stats = Review.objects.filter(recipe=OuterRef("pk")).values("recipe")
+    Recipe.objects.update(
+        rating_sum=Coalesce(
+            Subquery(stats.annotate(s=Sum("rating")).values("s")), 0
+        ),
+        total_ratings=Coalesce(
+            Subquery(stats.annotate(c=Count("pk")).values("c")), 0
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recipes", "0003_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="recipe",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_rating_sum, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-30 11:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0004_recipe_rating_sum'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['recipe', '-created_at'], name='recipes_rev_recipe__cc954d_idx'),
+        ),
+    ]
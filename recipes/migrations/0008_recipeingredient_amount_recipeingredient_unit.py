@@ -0,0 +1,55 @@
+# Generated by Django 5.2.17 on 2026-08-30 11:16
+
+import re
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+QUANTITY_RE = re.compile(r"^\s*([\d./]+)\s*(\w+)?")
+
+
+def parse_quantity(quantity):
+    """Split a display quantity like '2 cups' or '1/2 tsp' into (amount, unit)."""
+    match = QUANTITY_RE.match(quantity or "")
+    if not match:
+        return None, ""
+    number, unit = match.groups()
+    try:
+        if "/" in number:
+            numerator, _, denominator = number.partition("/")
+            amount = Decimal(numerator) / Decimal(denominator)
+        else:
+            amount = Decimal(number)
+    except (InvalidOperation, ZeroDivisionError):
+        return None, ""
+    return amount.quantize(Decimal("0.001")), (unit or "")[:20]
+
+
+def backfill_amount_unit(apps, schema_editor):
+    RecipeIngredient = apps.get_model("recipes", "RecipeIngredient")
+    batch = []
+    for ri in RecipeIngredient.objects.all().iterator(chunk_size=1000):
+        ri.amount, ri.unit = parse_quantity(ri.quantity)
+        batch.append(ri)
+    RecipeIngredient.objects.bulk_update(batch, ["amount", "unit"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0007_remove_recipe_recipes_rec_author__e2628b_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipeingredient',
+            name='amount',
+            field=models.DecimalField(blank=True, decimal_places=3, max_digits=8, null=True),
+        ),
+        migrations.AddField(
+            model_name='recipeingredient',
+            name='unit',
+            field=models.CharField(blank=True, max_length=20),
+        ),
+        migrations.RunPython(backfill_amount_unit, migrations.RunPython.noop),
+    ]
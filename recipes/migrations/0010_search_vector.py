@@ -0,0 +1,58 @@
+"""
+Stored tsvector column + GIN index for full-text recipe search
+(PostgreSQL only).
+
+Complements the trigram indexes from 0003: trigram similarity catches
+near-misses and typos, while the tsvector match handles stemmed word
+queries ("bake" vs "baking") through an index instead of computing
+to_tsvector per row per query. The column is a generated column kept by
+Postgres itself, so no trigger or signal handler is needed. On SQLite
+(dev) this is a no-op and the view keeps its icontains fallback; a
+tsvector column cannot be expressed as a model field there.
+"""
+
+from django.db import migrations
+
+ADD_COLUMN_SQL = """
+ALTER TABLE recipes_recipe ADD COLUMN IF NOT EXISTS search_vector tsvector
+GENERATED ALWAYS AS (
+    to_tsvector(
+        'english',
+        coalesce(title, '') || ' ' ||
+        coalesce(description, '') || ' ' ||
+        coalesce(instructions, '')
+    )
+) STORED
+"""
+
+
+def create_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(ADD_COLUMN_SQL)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS recipe_search_vector_gin "
+            "ON recipes_recipe USING gin (search_vector)"
+        )
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP INDEX IF EXISTS recipe_search_vector_gin")
+        cursor.execute(
+            "ALTER TABLE recipes_recipe DROP COLUMN IF EXISTS search_vector"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("recipes", "0009_recipe_image_height_recipe_image_width"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_vector, drop_search_vector),
+    ]
@@ -1,8 +1,33 @@
+import re
+from decimal import Decimal, InvalidOperation
+
 from django.db import models
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+QUANTITY_RE = re.compile(r"^\s*([\d./]+)\s*(\w+)?")
+
+
+def parse_quantity(quantity):
+    """Split a display quantity like '2 cups' or '1/2 tsp' into (amount, unit).
+
+    Returns (None, "") when the string has no leading number.
+    """
+    match = QUANTITY_RE.match(quantity or "")
+    if not match:
+        return None, ""
+    number, unit = match.groups()
+    try:
+        if "/" in number:
+            numerator, _, denominator = number.partition("/")
+            amount = Decimal(numerator) / Decimal(denominator)
+        else:
+            amount = Decimal(number)
+    except (InvalidOperation, ZeroDivisionError):
+        return None, ""
+    return amount.quantize(Decimal("0.001")), (unit or "")[:20]
+
 
 class Category(models.Model):
     """Recipe categories (e.g., Italian, Mexican, Dessert)"""
@@ -51,9 +76,14 @@ class Recipe(models.Model):
     
     # Media
     image = models.ImageField(upload_to="recipe_images/", blank=True, null=True)
+    # Cached dimensions filled in asynchronously by recipes.images; the
+    # templates emit them as width/height attributes so browsers can
+    # reserve layout space without a request-path Pillow decode.
+    image_width = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    image_height = models.PositiveIntegerField(null=True, blank=True, editable=False)
     
     # Relationships
-    category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True)
+    category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True, related_name="recipes")
     ingredients = models.ManyToManyField(Ingredient, through="RecipeIngredient", related_name="recipes")
     
     # Instructions
@@ -67,18 +97,36 @@ class Recipe(models.Model):
     # ML-related fields
     average_rating = models.FloatField(default=0.0, validators=[MinValueValidator(0.0), MaxValueValidator(5.0)])
     total_ratings = models.PositiveIntegerField(default=0)
+    # Running sum of review ratings so average_rating can be maintained
+    # with O(1) F-expression updates instead of re-aggregating all reviews.
+    rating_sum = models.PositiveIntegerField(default=0, editable=False)
+
+    # Denormalized document for RAG indexing / search, kept in sync by
+    # signal handlers in chatbot.signals so indexing reads a single column
+    # instead of traversing ingredients and category per recipe.
+    search_document = models.TextField(default="", blank=True, editable=False)
     
     class Meta:
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["-created_at"]),
             models.Index(fields=["category"]),
-            models.Index(fields=["author"]),
+            # Composite serves both ownership checks (author prefix) and
+            # author-filtered listings ordered by recency, without a sort.
+            models.Index(fields=["author", "-created_at"]),
         ]
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the image as loaded so only new uploads get re-measured."""
+        instance = super().from_db(db, field_names, values)
+        if "image" in field_names:
+            instance._loaded_image_name = instance.image.name if instance.image else ""
+        return instance
+
     def get_absolute_url(self):
         return reverse("recipe_detail", kwargs={"pk": self.pk})
 
@@ -92,6 +140,11 @@ class RecipeIngredient(models.Model):
     recipe = models.ForeignKey(Recipe, on_delete=models.CASCADE, related_name="recipe_ingredients")
     ingredient = models.ForeignKey(Ingredient, on_delete=models.CASCADE)
     quantity = models.CharField(max_length=100, help_text="e.g., '2 cups', '1 tablespoon', '500g'")
+    # Structured split of quantity so scaling/arithmetic can happen in SQL
+    # instead of re-parsing the display string. quantity stays the legacy
+    # display value; the data migration backfills these from it.
+    amount = models.DecimalField(max_digits=8, decimal_places=3, null=True, blank=True)
+    unit = models.CharField(max_length=20, blank=True)
     notes = models.CharField(max_length=200, blank=True, help_text="Optional notes about this ingredient")
 
     class Meta:
@@ -101,6 +154,21 @@ class RecipeIngredient(models.Model):
     def __str__(self):
         return f"{self.quantity} {self.ingredient.name} for {self.recipe.title}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the quantity as loaded so edits trigger a re-parse."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_quantity = instance.quantity
+        return instance
+
+    def save(self, *args, **kwargs):
+        """Keep the structured amount/unit in sync with the display string"""
+        old_quantity = getattr(self, "_loaded_quantity", None)
+        if self.amount is None or self.quantity != old_quantity:
+            self.amount, self.unit = parse_quantity(self.quantity)
+        super().save(*args, **kwargs)
+        self._loaded_quantity = self.quantity
+
 
 class Review(models.Model):
     """User reviews and ratings for recipes"""
@@ -117,38 +185,115 @@ class Review(models.Model):
     class Meta:
         unique_together = ["recipe", "user"]  # One review per user per recipe
         ordering = ["-created_at"]
+        indexes = [
+            # Serves the detail page slice and the keyset "load more"
+            # endpoint (created_at < before) as an index range scan.
+            models.Index(fields=["recipe", "-created_at"]),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.rating} stars for {self.recipe.title}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the rating as loaded so edits can apply a delta."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = instance.rating
+        return instance
+
     def save(self, *args, **kwargs):
         """Update recipe's average rating when review is saved"""
+        is_new = self._state.adding
+        old_rating = getattr(self, "_loaded_rating", None)
         super().save(*args, **kwargs)
-        self.update_recipe_rating()
+        if is_new or old_rating is None:
+            self._schedule_rating_delta(self.recipe_id, self.rating, 1)
+        elif self.rating != old_rating:
+            self._schedule_rating_delta(self.recipe_id, self.rating - old_rating, 0)
+        self._loaded_rating = self.rating
 
     def delete(self, *args, **kwargs):
         """Update recipe's average rating when review is deleted"""
-        recipe = self.recipe
+        recipe_id = self.recipe_id
+        rating = getattr(self, "_loaded_rating", self.rating)
         super().delete(*args, **kwargs)
-        recipe.refresh_from_db()
-        self._update_recipe_rating_for_recipe(recipe)
+        self._schedule_rating_delta(recipe_id, -rating, -1)
+
+    @staticmethod
+    def _schedule_rating_delta(recipe_id, rating_delta, count_delta):
+        """Defer the rating UPDATE until after commit, off the request path.
+
+        on_commit keeps the counters consistent (deltas for rolled-back
+        reviews never run); the worker thread takes the write itself off
+        the response's critical path.
+        """
+        from django.db import transaction
+
+        from recipes.ratings import schedule_rating_update
+
+        transaction.on_commit(
+            lambda: schedule_rating_update(recipe_id, rating_delta, count_delta)
+        )
 
     def update_recipe_rating(self):
-        """Calculate and update the recipe's average rating"""
+        """Recompute the recipe's rating columns from scratch"""
         self._update_recipe_rating_for_recipe(self.recipe)
 
+    @staticmethod
+    def _apply_rating_delta(recipe_id, rating_delta, count_delta):
+        """Apply an incremental rating change with a single O(1) UPDATE.
+
+        Avoids re-aggregating every review of the recipe on each write;
+        the running rating_sum keeps average_rating derivable in place.
+        """
+        from django.db.models import Case, F, FloatField, Value, When
+        from django.db.models.functions import Round
+
+        # The * 1.0 forces float division (Postgres truncates int / int).
+        new_average = Round(
+            (F("rating_sum") + rating_delta) * 1.0
+            / (F("total_ratings") + count_delta),
+            2,
+        )
+        if count_delta < 0:
+            # Deleting the last review would divide by zero.
+            new_average = Case(
+                When(total_ratings=1, then=Value(0.0)),
+                default=new_average,
+                output_field=FloatField(),
+            )
+        Recipe.objects.filter(pk=recipe_id).update(
+            rating_sum=F("rating_sum") + rating_delta,
+            total_ratings=F("total_ratings") + count_delta,
+            average_rating=new_average,
+        )
+
     @staticmethod
     def _update_recipe_rating_for_recipe(recipe):
-        """Helper method to update rating for a recipe"""
-        reviews = Review.objects.filter(recipe=recipe)
-        if reviews.exists():
-            avg_rating = reviews.aggregate(models.Avg("rating"))["rating__avg"]
-            recipe.average_rating = round(avg_rating, 2)
-            recipe.total_ratings = reviews.count()
-        else:
-            recipe.average_rating = 0.0
-            recipe.total_ratings = 0
-        recipe.save(update_fields=["average_rating", "total_ratings"])
+        """Full recompute of a recipe's rating columns.
+
+        Runs as a single UPDATE with correlated subqueries. The hot
+        write path uses _apply_rating_delta instead; this is the
+        resync/backfill fallback.
+        """
+        from django.db.models import Count, OuterRef, Subquery, Sum
+        from django.db.models.functions import Coalesce, Round
+
+        stats = Review.objects.filter(recipe=OuterRef("pk")).values("recipe")
+        Recipe.objects.filter(pk=recipe.pk).update(
+            average_rating=Coalesce(
+                Subquery(stats.annotate(a=Round(models.Avg("rating"), 2)).values("a")),
+                0.0,
+            ),
+            total_ratings=Coalesce(
+                Subquery(stats.annotate(c=Count("pk")).values("c")),
+                0,
+            ),
+            rating_sum=Coalesce(
+                Subquery(stats.annotate(s=Sum("rating")).values("s")),
+                0,
+            ),
+        )
 
 
 class UserProfile(models.Model):
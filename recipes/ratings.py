@@ -0,0 +1,63 @@
+"""
+Background application of recipe rating deltas.
+
+Review.save/delete used to run the rating UPDATE inside the request,
+adding a round-trip to every review POST. They now hand the delta to
+this worker via transaction.on_commit (so only committed reviews are
+counted) and return immediately. Same daemon-queue pattern as
+chatbot.history_writer and recipes.images.
+"""
+
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+QUEUE_MAX = 1000
+
+_queue = queue.Queue(maxsize=QUEUE_MAX)
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def schedule_rating_update(recipe_id, rating_delta, count_delta):
+    """Queue an incremental rating update for background application."""
+    _ensure_worker()
+    try:
+        _queue.put_nowait((recipe_id, rating_delta, count_delta))
+    except queue.Full:
+        # Best-effort: apply inline rather than losing the delta.
+        _apply(recipe_id, rating_delta, count_delta)
+
+
+def _ensure_worker():
+    global _worker
+    if _worker is not None and _worker.is_alive():
+        return
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run, name="recipe-rating-worker", daemon=True
+            )
+            _worker.start()
+
+
+def _apply(recipe_id, rating_delta, count_delta):
+    from recipes.models import Review
+
+    Review._apply_rating_delta(recipe_id, rating_delta, count_delta)
+
+
+def _run():
+    from django.db import close_old_connections
+
+    while True:
+        recipe_id, rating_delta, count_delta = _queue.get()
+        try:
+            close_old_connections()
+            _apply(recipe_id, rating_delta, count_delta)
+        except Exception:
+            logger.exception(
+                "Failed to apply rating delta for recipe %s", recipe_id
+            )
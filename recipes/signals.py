@@ -0,0 +1,35 @@
+"""
+Signal handlers for the recipes app.
+
+Drops the cached category sidebar whenever a category changes (see
+views._cached_categories) and hands freshly saved recipe images to the
+background dimension worker.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from recipes.images import schedule_image_processing
+from recipes.models import Category, Recipe
+
+CATEGORIES_CACHE_KEY = "recipes:categories:v1"
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def _category_changed(sender, instance, **kwargs):
+    cache.delete(CATEGORIES_CACHE_KEY)
+
+
+@receiver(post_save, sender=Recipe)
+def _recipe_image_saved(sender, instance, **kwargs):
+    # Only queue a decode when the file is new or changed; every Recipe
+    # save fires this handler, and re-measuring an unchanged image would
+    # reopen it with Pillow for nothing.
+    if not instance.image:
+        return
+    loaded_name = getattr(instance, "_loaded_image_name", None)
+    if loaded_name == instance.image.name and instance.image_width is not None:
+        return
+    schedule_image_processing(instance.pk)
@@ -6,6 +6,7 @@ app_name = "recipes"
 urlpatterns = [
     path("", views.RecipeListView.as_view(), name="recipe_list"),
     path("<int:pk>/", views.RecipeDetailView.as_view(), name="recipe_detail"),
+    path("<int:pk>/reviews/", views.recipe_reviews_api, name="recipe_reviews_api"),
     path("create/", views.RecipeCreateView.as_view(), name="recipe_create"),
     path("<int:pk>/edit/", views.RecipeUpdateView.as_view(), name="recipe_edit"),
     path("<int:pk>/delete/", views.RecipeDeleteView.as_view(), name="recipe_delete"),
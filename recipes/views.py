@@ -2,9 +2,60 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.decorators import login_required
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
-from django.db.models import Q
-from .models import Recipe, Category, Review
+from django.db import connection
+from django.db.models import Exists, F, OuterRef, Prefetch, Q
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils.dateparse import parse_datetime
+from .models import Recipe, Category, Ingredient, RecipeIngredient, Review
 from .forms import RecipeForm, ReviewForm
+from .signals import CATEGORIES_CACHE_KEY
+
+
+def _card_values(queryset):
+    """Project a Recipe queryset to the dict rows the card grid renders.
+
+    values() skips model-instance construction entirely (no __init__,
+    descriptors, or deferred-field bookkeeping per row), which matters
+    when rendering many cards. The template consumes the dict keys
+    directly, so total_time and the joined names are computed in SQL.
+    """
+    return queryset.values(
+        "id", "title", "description", "image", "image_width",
+        "image_height", "difficulty",
+        "servings", "average_rating", "total_ratings",
+        category_name=F("category__name"),
+        author_username=F("author__username"),
+        total_time=F("prep_time") + F("cook_time"),
+    )
+
+
+def _register_trigram_lookups():
+    """Register contrib.postgres's trigram_similar lookup.
+
+    INSTALLED_APPS cannot list django.contrib.postgres (the dev stack
+    has no psycopg), so the lookup behind the GIN-indexable % operator
+    is registered lazily the first time the Postgres search path runs.
+    """
+    from django.contrib.postgres.lookups import TrigramSimilar
+    from django.db import models
+
+    if "trigram_similar" not in models.CharField.get_lookups():
+        models.CharField.register_lookup(TrigramSimilar)
+        models.TextField.register_lookup(TrigramSimilar)
+
+
+def _cached_categories():
+    """Category list for the filter sidebar, cached for an hour.
+
+    Categories change rarely; recipes.signals drops the cache entry on
+    any Category save/delete.
+    """
+    categories = cache.get(CATEGORIES_CACHE_KEY)
+    if categories is None:
+        categories = list(Category.objects.only("id", "name"))
+        cache.set(CATEGORIES_CACHE_KEY, categories, 3600)
+    return categories
 
 
 class RecipeListView(ListView):
@@ -15,20 +66,23 @@ class RecipeListView(ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        queryset = Recipe.objects.select_related("author", "category").prefetch_related("reviews")
+        # Ratings shown on the cards come from the denormalized
+        # average_rating/total_ratings columns (kept in sync by Review.save),
+        # so there is no need to prefetch the review rows themselves.
+        queryset = Recipe.objects.all()
         category = self.request.GET.get("category")
         difficulty = self.request.GET.get("difficulty")
-        
+
         if category:
             queryset = queryset.filter(category_id=category)
         if difficulty:
             queryset = queryset.filter(difficulty=difficulty)
-            
-        return queryset
+
+        return _card_values(queryset)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["categories"] = Category.objects.all()
+        context["categories"] = _cached_categories()
         return context
 
 
@@ -38,30 +92,58 @@ class RecipeDetailView(DetailView):
     template_name = "recipes/recipe_detail.html"
     context_object_name = "recipe"
 
+    def get_queryset(self):
+        # Pull the author/category joins and the ten most recent reviews
+        # (with their users) alongside the recipe itself, instead of issuing
+        # separate queries from get_context_data. The slice keeps the
+        # prefetch bounded no matter how many reviews a recipe has.
+        return Recipe.objects.select_related("author", "category").prefetch_related(
+            Prefetch(
+                "reviews",
+                queryset=Review.objects.select_related("user").order_by("-created_at")[:10],
+                to_attr="recent_reviews",
+            )
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        recipe = self.get_object()
-        
-        # Check if user has already reviewed
+        # DetailView.get already fetched the recipe into self.object;
+        # calling get_object() again would repeat the SELECT.
+        recipe = self.object
+
+        # The user's own review may be older than the prefetched ten, so it
+        # needs its own indexed lookup.
         user_review = None
         if self.request.user.is_authenticated:
-            user_review = Review.objects.filter(recipe=recipe, user=self.request.user).first()
-        
+            user_review = Review.objects.filter(
+                recipe=recipe, user=self.request.user
+            ).first()
+
         context["user_review"] = user_review
-        context["reviews"] = recipe.reviews.select_related("user").order_by("-created_at")[:10]
+        context["reviews"] = recipe.recent_reviews
         context["review_form"] = ReviewForm()
         
-        # Similar recipes (same category)
-        if recipe.category:
-            context["similar_recipes"] = Recipe.objects.filter(
-                category=recipe.category
-            ).exclude(pk=recipe.pk)[:4]
-        
+        # Similar recipes (same category), cached for 10 minutes: popular
+        # recipes re-run the identical query on every page view otherwise.
+        if recipe.category_id:
+            context["similar_recipes"] = cache.get_or_set(
+                f"recipes:similar:{recipe.category_id}:{recipe.pk}",
+                lambda: list(
+                    Recipe.objects.filter(category_id=recipe.category_id)
+                    .exclude(pk=recipe.pk)
+                    .only(
+                        "id", "title", "image", "image_width",
+                        "image_height", "average_rating",
+                    )[:4]
+                ),
+                600,
+            )
+
         return context
 
     def post(self, request, *args, **kwargs):
         """Handle review submission"""
-        recipe = self.get_object()
+        self.object = recipe = self.get_object()
         
         if not request.user.is_authenticated:
             from django.contrib import messages
@@ -71,22 +153,57 @@ class RecipeDetailView(DetailView):
         form = ReviewForm(request.POST)
         
         if form.is_valid():
-            review, created = Review.objects.get_or_create(
+            # Single create-or-update path; avoids the second save() (and
+            # second rating recomputation) the old get_or_create branch ran.
+            Review.objects.update_or_create(
                 recipe=recipe,
                 user=request.user,
-                defaults=form.cleaned_data
+                defaults={
+                    "rating": form.cleaned_data["rating"],
+                    "comment": form.cleaned_data["comment"],
+                },
             )
-            if not created:
-                # Update existing review
-                review.rating = form.cleaned_data["rating"]
-                review.comment = form.cleaned_data["comment"]
-                review.save()
             from django.contrib import messages
             messages.success(request, "Review submitted successfully!")
         
         return redirect("recipes:recipe_detail", pk=recipe.pk)
 
 
+def recipe_reviews_api(request, pk):
+    """JSON "load more" feed of reviews for a recipe.
+
+    Uses keyset pagination (?before=<iso timestamp>) rather than OFFSET:
+    the (recipe, -created_at) index answers each page with a range scan,
+    so page 100 costs the same as page 1.
+    """
+    reviews = (
+        Review.objects.filter(recipe_id=pk)
+        .select_related("user")
+        .order_by("-created_at")
+    )
+    before = request.GET.get("before")
+    if before:
+        before_dt = parse_datetime(before)
+        if before_dt is None:
+            return JsonResponse({"error": "Invalid 'before' timestamp."}, status=400)
+        reviews = reviews.filter(created_at__lt=before_dt)
+
+    page = list(reviews[:10])
+    return JsonResponse({
+        "reviews": [
+            {
+                "user": review.user.username,
+                "rating": review.rating,
+                "comment": review.comment,
+                "created_at": review.created_at.isoformat(),
+            }
+            for review in page
+        ],
+        # Cursor for the next page; null when this page was short.
+        "next_before": page[-1].created_at.isoformat() if len(page) == 10 else None,
+    })
+
+
 class RecipeCreateView(LoginRequiredMixin, CreateView):
     """Create a new recipe"""
     model = Recipe
@@ -128,7 +245,10 @@ class CategoryDetailView(DetailView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["recipes"] = Recipe.objects.filter(category=self.get_object())
+        # Same card projection as RecipeListView.
+        context["recipes"] = _card_values(
+            Recipe.objects.filter(category=self.object)
+        )
         return context
 
 
@@ -141,14 +261,74 @@ class RecipeSearchView(ListView):
 
     def get_queryset(self):
         query = self.request.GET.get("q", "")
-        if query:
-            return Recipe.objects.filter(
+        if not query:
+            return Recipe.objects.none()
+        if connection.vendor == "postgresql":
+            # Trigram search backed by the pg_trgm GIN indexes (migration
+            # 0003). The filter must use trigram_similar — the % operator,
+            # which those indexes serve; a TrigramSimilarity(...) > x
+            # function-call predicate is not indexable, and one
+            # unindexable arm of the OR forces a sequential scan of the
+            # whole table. TrigramSimilarity is kept only as the ranking
+            # annotation for order_by.
+            from django.contrib.postgres.search import TrigramSimilarity
+            from django.db.models import BooleanField
+            from django.db.models.expressions import RawSQL
+            from django.db.models.functions import Greatest
+
+            _register_trigram_lookups()
+            similarity = Greatest(
+                TrigramSimilarity("title", query),
+                TrigramSimilarity("description", query),
+                TrigramSimilarity("instructions", query),
+            )
+            # Resolve matching ingredient ids first via the trigram index
+            # on Ingredient.name (trigram_similar, for the same index
+            # reasons as above), then drive the semi-join by PK instead
+            # of LIKE-ing the joined name column per recipe row.
+            matching_ingredients = Ingredient.objects.filter(
+                name__trigram_similar=query
+            ).values("id")
+            ingredient_match = Exists(
+                RecipeIngredient.objects.filter(
+                    recipe=OuterRef("pk"), ingredient_id__in=matching_ingredients
+                )
+            )
+            # Stemmed word match against the stored generated tsvector
+            # column (migration 0010) — catches "baking" for "bake", which
+            # trigram similarity can miss. The column only exists on
+            # Postgres, hence RawSQL rather than a model field.
+            fts = RawSQL(
+                "search_vector @@ plainto_tsquery('english', %s)",
+                (query,),
+                output_field=BooleanField(),
+            )
+            return _card_values(
+                Recipe.objects.annotate(similarity=similarity, fts_match=fts)
+                .filter(
+                    Q(title__trigram_similar=query) |
+                    Q(description__trigram_similar=query) |
+                    Q(instructions__trigram_similar=query) |
+                    Q(fts_match=True) |
+                    Q(ingredient_match)
+                )
+                .order_by("-similarity")
+            )
+        # SQLite (dev) has no pg_trgm; keep the substring fallback with an
+        # EXISTS semi-join so there is still no fan-out to de-dupe.
+        ingredient_match = Exists(
+            RecipeIngredient.objects.filter(
+                recipe=OuterRef("pk"), ingredient__name__icontains=query
+            )
+        )
+        return _card_values(
+            Recipe.objects.filter(
                 Q(title__icontains=query) |
                 Q(description__icontains=query) |
                 Q(instructions__icontains=query) |
-                Q(ingredients__name__icontains=query)
-            ).distinct()
-        return Recipe.objects.none()
+                Q(ingredient_match)
+            )
+        )
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
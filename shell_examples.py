@@ -8,7 +8,9 @@ Then copy/paste sections below
 # STEP 1: Import Models
 # ============================================
 from recipes.models import Recipe, Category, Ingredient, Review, RecipeIngredient
+from chatbot.signals import refresh_search_documents
 from django.contrib.auth.models import User
+from django.db import transaction
 from django.db.models import Avg, Count, Sum, Q, F
 from django.utils import timezone
 
@@ -32,140 +34,167 @@ if created:
 else:
     print(f"✅ Using existing user: {user.username}")
 
-# Create categories
-italian, _ = Category.objects.get_or_create(
-    name="Italian",
-    defaults={"description": "Traditional Italian cuisine"}
-)
-mexican, _ = Category.objects.get_or_create(
-    name="Mexican",
-    defaults={"description": "Authentic Mexican dishes"}
-)
-dessert, _ = Category.objects.get_or_create(
-    name="Dessert",
-    defaults={"description": "Sweet treats"}
-)
-print("✅ Categories ready")
+# Create categories and ingredients inside one transaction: a single
+# COMMIT (one fsync) instead of one implicit autocommit per object
+with transaction.atomic():
+    italian, _ = Category.objects.get_or_create(
+        name="Italian",
+        defaults={"description": "Traditional Italian cuisine"}
+    )
+    mexican, _ = Category.objects.get_or_create(
+        name="Mexican",
+        defaults={"description": "Authentic Mexican dishes"}
+    )
+    dessert, _ = Category.objects.get_or_create(
+        name="Dessert",
+        defaults={"description": "Sweet treats"}
+    )
 
-# Create ingredients
-ingredients_data = [
-    "Tomato", "Mozzarella Cheese", "Flour", "Eggs",
-    "Olive Oil", "Garlic", "Basil", "Pasta",
-    "Chocolate", "Sugar", "Butter", "Vanilla"
-]
+    ingredients_data = [
+        "Tomato", "Mozzarella Cheese", "Flour", "Eggs",
+        "Olive Oil", "Garlic", "Basil", "Pasta",
+        "Chocolate", "Sugar", "Butter", "Vanilla"
+    ]
 
-for ing_name in ingredients_data:
-    Ingredient.objects.get_or_create(name=ing_name)
+    # One INSERT for all 12 ingredients; existing rows are left alone
+    Ingredient.objects.bulk_create(
+        [Ingredient(name=ing_name) for ing_name in ingredients_data],
+        ignore_conflicts=True,
+    )
+
+print("✅ Categories ready")
 print("✅ Ingredients ready")
 
+# Load all ingredients once; the recipe sections below look them up from
+# this dict instead of issuing one SELECT per name
+ings = {i.name: i for i in Ingredient.objects.all()}
+
 # ============================================
 # STEP 3: CREATE Recipes
 # ============================================
 
 # Recipe 1: Margherita Pizza
-recipe1, created = Recipe.objects.get_or_create(
-    title="Margherita Pizza",
-    defaults={
-        "description": "Classic Italian pizza with fresh tomatoes, mozzarella, and basil",
-        "author": user,
-        "category": italian,
-        "prep_time": 30,
-        "cook_time": 15,
-        "servings": 4,
-        "difficulty": "easy",
-        "instructions": """1. Prepare pizza dough and let it rise
+with transaction.atomic():
+    recipe1, created = Recipe.objects.get_or_create(
+        title="Margherita Pizza",
+        defaults={
+            "description": "Classic Italian pizza with fresh tomatoes, mozzarella, and basil",
+            "author": user,
+            "category": italian,
+            "prep_time": 30,
+            "cook_time": 15,
+            "servings": 4,
+            "difficulty": "easy",
+            "instructions": """1. Prepare pizza dough and let it rise
 2. Roll out dough into a circle
 3. Spread tomato sauce
 4. Add mozzarella cheese
 5. Bake at 450°F for 12-15 minutes
 6. Top with fresh basil leaves"""
-    }
-)
-if created:
-    # Add ingredients with quantities
-    tomato = Ingredient.objects.get(name="Tomato")
-    cheese = Ingredient.objects.get(name="Mozzarella Cheese")
-    flour = Ingredient.objects.get(name="Flour")
-    
-    RecipeIngredient.objects.create(
-        recipe=recipe1,
-        ingredient=flour,
-        quantity="2 cups",
-        notes="All-purpose flour"
+        }
     )
-    RecipeIngredient.objects.create(
-        recipe=recipe1,
-        ingredient=tomato,
-        quantity="1 cup",
-        notes="Crushed tomatoes"
-    )
-    RecipeIngredient.objects.create(
-        recipe=recipe1,
-        ingredient=cheese,
-        quantity="200g",
-        notes="Fresh mozzarella"
-    )
-    print(f"✅ Created: {recipe1.title}")
+    if created:
+        # Add ingredients with quantities (one INSERT for all rows)
+        tomato = ings["Tomato"]
+        cheese = ings["Mozzarella Cheese"]
+        flour = ings["Flour"]
+
+        RecipeIngredient.objects.bulk_create([
+            RecipeIngredient(
+                recipe=recipe1,
+                ingredient=flour,
+                quantity="2 cups",
+                notes="All-purpose flour"
+            ),
+            RecipeIngredient(
+                recipe=recipe1,
+                ingredient=tomato,
+                quantity="1 cup",
+                notes="Crushed tomatoes"
+            ),
+            RecipeIngredient(
+                recipe=recipe1,
+                ingredient=cheese,
+                quantity="200g",
+                notes="Fresh mozzarella"
+            ),
+        ])
+        # bulk_create fires no signals, so rebuild the denormalized
+        # search document now that the ingredients are attached
+        refresh_search_documents([recipe1.pk])
+        print(f"✅ Created: {recipe1.title}")
 
 # Recipe 2: Chocolate Cake
-recipe2, created = Recipe.objects.get_or_create(
-    title="Chocolate Cake",
-    defaults={
-        "description": "Rich and moist chocolate cake perfect for celebrations",
-        "author": user,
-        "category": dessert,
-        "prep_time": 20,
-        "cook_time": 35,
-        "servings": 8,
-        "difficulty": "medium",
-        "instructions": """1. Preheat oven to 350°F
+with transaction.atomic():
+    recipe2, created = Recipe.objects.get_or_create(
+        title="Chocolate Cake",
+        defaults={
+            "description": "Rich and moist chocolate cake perfect for celebrations",
+            "author": user,
+            "category": dessert,
+            "prep_time": 20,
+            "cook_time": 35,
+            "servings": 8,
+            "difficulty": "medium",
+            "instructions": """1. Preheat oven to 350°F
 2. Mix dry ingredients
 3. Add wet ingredients
 4. Pour into greased pan
 5. Bake for 30-35 minutes
 6. Let cool before frosting"""
-    }
-)
-if created:
-    chocolate = Ingredient.objects.get(name="Chocolate")
-    sugar = Ingredient.objects.get(name="Sugar")
-    flour = Ingredient.objects.get(name="Flour")
-    eggs = Ingredient.objects.get(name="Eggs")
-    
-    RecipeIngredient.objects.create(recipe=recipe2, ingredient=chocolate, quantity="200g")
-    RecipeIngredient.objects.create(recipe=recipe2, ingredient=sugar, quantity="1 cup")
-    RecipeIngredient.objects.create(recipe=recipe2, ingredient=flour, quantity="1.5 cups")
-    RecipeIngredient.objects.create(recipe=recipe2, ingredient=eggs, quantity="3 large")
-    print(f"✅ Created: {recipe2.title}")
+        }
+    )
+    if created:
+        chocolate = ings["Chocolate"]
+        sugar = ings["Sugar"]
+        flour = ings["Flour"]
+        eggs = ings["Eggs"]
+
+        RecipeIngredient.objects.bulk_create([
+            RecipeIngredient(recipe=recipe2, ingredient=chocolate, quantity="200g"),
+            RecipeIngredient(recipe=recipe2, ingredient=sugar, quantity="1 cup"),
+            RecipeIngredient(recipe=recipe2, ingredient=flour, quantity="1.5 cups"),
+            RecipeIngredient(recipe=recipe2, ingredient=eggs, quantity="3 large"),
+        ])
+        # bulk_create fires no signals, so rebuild the denormalized
+        # search document now that the ingredients are attached
+        refresh_search_documents([recipe2.pk])
+        print(f"✅ Created: {recipe2.title}")
 
 # Recipe 3: Pasta Carbonara
-recipe3, created = Recipe.objects.get_or_create(
-    title="Pasta Carbonara",
-    defaults={
-        "description": "Creamy Italian pasta with eggs, cheese, and pancetta",
-        "author": user,
-        "category": italian,
-        "prep_time": 15,
-        "cook_time": 20,
-        "servings": 4,
-        "difficulty": "medium",
-        "instructions": """1. Cook pasta al dente
+with transaction.atomic():
+    recipe3, created = Recipe.objects.get_or_create(
+        title="Pasta Carbonara",
+        defaults={
+            "description": "Creamy Italian pasta with eggs, cheese, and pancetta",
+            "author": user,
+            "category": italian,
+            "prep_time": 15,
+            "cook_time": 20,
+            "servings": 4,
+            "difficulty": "medium",
+            "instructions": """1. Cook pasta al dente
 2. Fry pancetta until crispy
 3. Mix eggs and cheese
 4. Combine hot pasta with egg mixture
 5. Add pancetta and black pepper
 6. Serve immediately"""
-    }
-)
-if created:
-    pasta = Ingredient.objects.get(name="Pasta")
-    eggs = Ingredient.objects.get(name="Eggs")
-    cheese = Ingredient.objects.get(name="Mozzarella Cheese")
-    
-    RecipeIngredient.objects.create(recipe=recipe3, ingredient=pasta, quantity="400g")
-    RecipeIngredient.objects.create(recipe=recipe3, ingredient=eggs, quantity="4 large")
-    RecipeIngredient.objects.create(recipe=recipe3, ingredient=cheese, quantity="100g")
-    print(f"✅ Created: {recipe3.title}")
+        }
+    )
+    if created:
+        pasta = ings["Pasta"]
+        eggs = ings["Eggs"]
+        cheese = ings["Mozzarella Cheese"]
+
+        RecipeIngredient.objects.bulk_create([
+            RecipeIngredient(recipe=recipe3, ingredient=pasta, quantity="400g"),
+            RecipeIngredient(recipe=recipe3, ingredient=eggs, quantity="4 large"),
+            RecipeIngredient(recipe=recipe3, ingredient=cheese, quantity="100g"),
+        ])
+        # bulk_create fires no signals, so rebuild the denormalized
+        # search document now that the ingredients are attached
+        refresh_search_documents([recipe3.pk])
+        print(f"✅ Created: {recipe3.title}")
 
 print("\n" + "="*50)
 print("✅ Sample data created!")
@@ -177,39 +206,40 @@ print("="*50 + "\n")
 
 print("📊 QUERY EXAMPLES:\n")
 
-# 1. Get all recipes
+# 1. Get all recipes (iterator() streams rows instead of caching the
+#    whole queryset; on Postgres it uses a server-side cursor)
 print("1. All recipes:")
-for recipe in Recipe.objects.all():
+for recipe in Recipe.objects.all().iterator(chunk_size=1000):
     print(f"   - {recipe.title} ({recipe.difficulty})")
 
 # 2. Filter by difficulty
 print("\n2. Easy recipes:")
 easy = Recipe.objects.filter(difficulty="easy")
-for recipe in easy:
+for recipe in easy.iterator(chunk_size=1000):
     print(f"   - {recipe.title}")
 
 # 3. Filter by category
 print("\n3. Italian recipes:")
 italian_recipes = Recipe.objects.filter(category__name="Italian")
-for recipe in italian_recipes:
+for recipe in italian_recipes.iterator(chunk_size=1000):
     print(f"   - {recipe.title}")
 
 # 4. Filter with comparison
 print("\n4. Recipes with prep_time >= 20 minutes:")
 long_prep = Recipe.objects.filter(prep_time__gte=20)
-for recipe in long_prep:
+for recipe in long_prep.iterator(chunk_size=1000):
     print(f"   - {recipe.title}: {recipe.prep_time} min")
 
 # 5. Search in title
 print("\n5. Recipes containing 'Pizza':")
 pizza_recipes = Recipe.objects.filter(title__icontains="Pizza")
-for recipe in pizza_recipes:
+for recipe in pizza_recipes.iterator(chunk_size=1000):
     print(f"   - {recipe.title}")
 
 # 6. Order by created date
 print("\n6. Recipes ordered by newest:")
 newest = Recipe.objects.order_by("-created_at")
-for recipe in newest:
+for recipe in newest.iterator(chunk_size=1000):
     print(f"   - {recipe.title} ({recipe.created_at})")
 
 # 7. Get recipe with ingredients
@@ -234,7 +264,7 @@ print(f"   Average: {avg_prep['prep_time__avg']:.1f} minutes")
 
 # 10. Recipes per category
 print("\n10. Recipes per category:")
-categories = Category.objects.annotate(recipe_count=Count("recipe_set"))
+categories = Category.objects.annotate(recipe_count=Count("recipes"))
 for cat in categories:
     print(f"   {cat.name}: {cat.recipe_count} recipes")
 